@@ -1,7 +1,9 @@
 from flask import Flask, jsonify, request
+import json
 import os
 from binance.um_futures import UMFutures
 from binance.error import ClientError
+from requests.adapters import HTTPAdapter
 
 app = Flask(__name__)
 
@@ -11,12 +13,21 @@ API_SECRET = os.environ.get("BINANCE_API_SECRET", "")
 
 client = UMFutures(key=API_KEY, secret=API_SECRET)
 
+# --- ขยาย connection pool ของ session เดิม เพื่อ reuse TLS connection ทุก request ---
+client.session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=0),
+)
+
+# encode response ของหน้าแรกไว้ล่วงหน้า ไม่ต้อง serialize ใหม่ทุก request
+_HOME_BODY = json.dumps({
+    "status": "ok",
+    "message": "Cloud Run Flask server is working with Binance Futures!"
+})
+
 @app.route('/')
 def home():
-    return jsonify({
-        "status": "ok",
-        "message": "Cloud Run Flask server is working with Binance Futures!"
-    })
+    return app.response_class(_HOME_BODY, mimetype="application/json")
 
 # ✅ Route ดึงยอดเงิน Futures
 @app.route('/futures/balance')